@@ -1,12 +1,15 @@
-from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks
+from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
+import hashlib
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
-from typing import List, Optional, Dict
+from typing import Any, List, Optional, Dict
 import uuid
 from datetime import datetime, timezone
 
@@ -566,8 +569,21 @@ class PersonaUpdate(BaseModel):
     organization_id: str = None
     tags: list[str] = None
 
+def etag_json_response(request: Request, payload: Any) -> Response:
+    """JSON response tagged with a hash of its body
+    
+    Clients that send the same ETag back in If-None-Match get an empty 304,
+    so rarely-changing lists aren't re-downloaded on every run.
+    """
+    response = JSONResponse(jsonable_encoder(payload))
+    etag = f'"{hashlib.sha1(response.body).hexdigest()}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
 @api_router.get("/personas")
-async def list_personas(organization_id: str = None):
+async def list_personas(request: Request, organization_id: str = None):
     """List all personas using PersonaManager"""
     if not persona_manager:
         raise HTTPException(status_code=500, detail="Persona manager not initialized")
@@ -581,7 +597,7 @@ async def list_personas(organization_id: str = None):
             if "tags" in p.metadata:
                 persona_dict["tags"] = p.metadata["tags"]
             result.append(persona_dict)
-        return result
+        return etag_json_response(request, result)
     except Exception as e:
         print(f"Error listing personas: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -856,7 +872,7 @@ async def generate_goal_background(job_id: str, request: GoalGenerateRequest):
         update_job(job_id, status="failed", error=str(e), stage="Generation failed")
 
 @api_router.get("/goals")
-async def list_goals():
+async def list_goals(request: Request):
     """List all goals using GoalManager"""
     if not storage:
         raise HTTPException(status_code=500, detail="Storage not initialized")
@@ -872,7 +888,7 @@ async def list_goals():
             if "product_id" in g.metadata:
                 goal_dict["product_id"] = g.metadata["product_id"]
             result.append(goal_dict)
-        return result
+        return etag_json_response(request, result)
     except Exception as e:
         print(f"Error listing goals: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1287,7 +1303,7 @@ async def run_simulation(
 
 async def run_simulation_background(thread_id: str, persona_id: str, goal_id: str, max_turns: int, reasoning_model: str, reasoning_effort: str):
     """Background task for running simulation loop on existing thread"""
-    from thread_status import set_thread_status
+    from thread_status import delete_thread_status, set_thread_status
     
     try:
         # Run simulation loop with existing thread_id
@@ -1301,6 +1317,8 @@ async def run_simulation_background(thread_id: str, persona_id: str, goal_id: st
         )
         
         logger.info(f"Simulation completed successfully - thread_id: {thread_id}")
+        # Drop the "running" flag so status is read from the thread state and long-polls wake
+        delete_thread_status(thread_id)
         
     except Exception as e:
         logger.error(f"Error in simulation background for thread {thread_id}: {e}")
@@ -1459,10 +1477,16 @@ async def get_thread_messages(thread_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch thread messages: {str(e)}")
 
+# Upper bound on how long a status request may be held open
+MAX_STATUS_WAIT = 30
+
 @api_router.get("/threads/{thread_id}/status")
-async def get_thread_status_endpoint(thread_id: str):
+async def get_thread_status_endpoint(thread_id: str, wait: float = 0):
     """Get simulation status for a thread
     
+    With wait > 0 a running thread is long-polled: the response is held until
+    its status changes or `wait` seconds (at most MAX_STATUS_WAIT) pass.
+    
     Returns:
         {
             "status": "running" | "completed" | "failed" | "unknown",
@@ -1471,10 +1495,12 @@ async def get_thread_status_endpoint(thread_id: str):
             "max_turns": 5
         }
     """
-    from thread_status import get_thread_status
+    from thread_status import get_thread_status, wait_for_thread_update
     
     # Try in-memory status first
     status_data = get_thread_status(thread_id)
+    if wait > 0 and status_data.get("status") == "running":
+        status_data = await wait_for_thread_update(thread_id, "running", min(wait, MAX_STATUS_WAIT))
     
     # If status is unknown, check actual thread state
     if status_data.get("status") == "unknown":
@@ -1770,6 +1796,58 @@ async def get_evaluation(eval_id: str):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch evaluation: {str(e)}")
 
+# ==================== BATCH ENDPOINT ====================
+
+MAX_BATCH_SIZE = 20
+
+# Set on every request dispatched from inside a batch. The handler rejects any
+# request carrying it, so batches can't nest however the item path is spelled.
+BATCH_DISPATCH_HEADER = "X-Batch-Dispatch"
+
+class BatchItem(BaseModel):
+    method: str = "GET"
+    path: str  # Relative to /api, e.g. "/products/{id}"
+    body: Optional[Any] = None
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem]
+
+@api_router.post("/batch")
+async def run_batch(batch: BatchRequest, request: Request):
+    """Execute several independent API calls in a single round trip
+    
+    Items are dispatched in-process against this app and run concurrently,
+    so they must not depend on each other.
+    
+    Returns:
+        [{"status": 200, "body": {...}}, ...] in request order
+    """
+    import asyncio
+    import httpx
+    
+    if request.headers.get(BATCH_DISPATCH_HEADER):
+        raise HTTPException(status_code=400, detail="Nested batch requests are not allowed")
+    if len(batch.requests) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"Batch exceeds {MAX_BATCH_SIZE} requests")
+    
+    # An item whose handler raises comes back as its own 500 instead of failing the batch
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://batch",
+        headers={BATCH_DISPATCH_HEADER: "1"},
+    ) as batch_client:
+        async def dispatch(item: BatchItem):
+            path = item.path.lstrip("/")
+            response = await batch_client.request(item.method.upper(), f"/api/{path}", json=item.body)
+            try:
+                body = response.json()
+            except ValueError:
+                body = response.text
+            return {"status": response.status_code, "body": body}
+        
+        return await asyncio.gather(*(dispatch(item) for item in batch.requests))
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -4,12 +4,25 @@ Lightweight in-memory status per thread_id.
 No complex session objects, just status flags.
 """
 
+import asyncio
 from threading import Lock
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
 # Simple dict: {thread_id: {"status": "running"|"completed", "stopped_reason": "...", ...}}
 thread_statuses: Dict[str, Dict] = {}
 status_lock = Lock()
+# Long-polling readers per thread, woken on every change: {thread_id: [(loop, event), ...]}
+status_waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+
+def _notify_waiters(thread_id: str) -> None:
+    """Wake readers waiting on a thread; call with status_lock held."""
+    for loop, event in status_waiters.get(thread_id, ()):
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # The waiter's loop has closed; its wait is already over
+            pass
 
 
 def set_thread_status(
@@ -40,6 +53,8 @@ def set_thread_status(
             thread_statuses[thread_id]["current_turn"] = current_turn
         if max_turns is not None:
             thread_statuses[thread_id]["max_turns"] = max_turns
+        
+        _notify_waiters(thread_id)
 
 
 def get_thread_status(thread_id: str) -> Dict:
@@ -57,3 +72,45 @@ def delete_thread_status(thread_id: str) -> None:
     with status_lock:
         if thread_id in thread_statuses:
             del thread_statuses[thread_id]
+            _notify_waiters(thread_id)
+
+
+async def wait_for_thread_update(thread_id: str, status: str, timeout: float) -> Dict:
+    """Wait until a thread's status is no longer `status`, or `timeout` elapses.
+    
+    Waits on the event loop rather than holding a worker thread, and stops
+    waiting as soon as the calling task is cancelled.
+    
+    Returns:
+        Dict with the current status info, as get_thread_status would return it
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    event = asyncio.Event()
+    waiter = (loop, event)
+    
+    with status_lock:
+        status_waiters.setdefault(thread_id, []).append(waiter)
+    try:
+        while True:
+            with status_lock:
+                current = thread_statuses.get(thread_id, {"status": "unknown"})
+                if current["status"] != status:
+                    return current
+                # Cleared under the lock, so a change after this check still sets it
+                event.clear()
+            
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return current
+            try:
+                await asyncio.wait_for(event.wait(), remaining)
+            except asyncio.TimeoutError:
+                pass
+    finally:
+        with status_lock:
+            waiters = status_waiters.get(thread_id, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                status_waiters.pop(thread_id, None)
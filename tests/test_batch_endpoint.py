@@ -0,0 +1,93 @@
+"""Tests for POST /api/batch"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "test_batch_endpoint")
+
+import server  # noqa: E402
+from thread_status import delete_thread_status, set_thread_status  # noqa: E402
+
+
+@server.app.get("/api/test-batch-boom")
+async def boom():
+    raise RuntimeError("boom")
+
+
+@pytest.fixture
+def client():
+    with TestClient(server.app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def seeded_threads():
+    set_thread_status("batch-thread-a", "running", current_turn=1, max_turns=5)
+    set_thread_status("batch-thread-b", "completed", stopped_reason="max_turns_reached")
+    yield
+    delete_thread_status("batch-thread-a")
+    delete_thread_status("batch-thread-b")
+
+
+def test_results_come_back_in_request_order(client, seeded_threads):
+    response = client.post("/api/batch", json={"requests": [
+        {"path": "/threads/batch-thread-b/status"},
+        {"path": "/no-such-route"},
+        {"path": "threads/batch-thread-a/status"},
+    ]})
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["status"] for r in results] == [200, 404, 200]
+    assert results[0]["body"]["status"] == "completed"
+    assert results[2]["body"]["status"] == "running"
+
+
+def test_batch_size_is_capped(client):
+    items = [{"path": "/no-such-route"}] * (server.MAX_BATCH_SIZE + 1)
+    response = client.post("/api/batch", json={"requests": items})
+
+    assert response.status_code == 400
+
+    items = items[:server.MAX_BATCH_SIZE]
+    response = client.post("/api/batch", json={"requests": items})
+
+    assert response.status_code == 200
+    assert len(response.json()) == server.MAX_BATCH_SIZE
+
+
+def test_failing_item_does_not_fail_the_batch(client, seeded_threads):
+    response = client.post("/api/batch", json={"requests": [
+        {"path": "/threads/batch-thread-b/status"},
+        {"path": "/test-batch-boom"},
+    ]})
+
+    assert response.status_code == 200
+    assert [r["status"] for r in response.json()] == [200, 500]
+
+
+@pytest.mark.parametrize("path", ["/batch", "./batch", "%62atch", "products/../batch"])
+def test_nested_batches_are_rejected(client, path):
+    nested = {"method": "POST", "path": path, "body": {"requests": [{"path": "/no-such-route"}]}}
+    response = client.post("/api/batch", json={"requests": [nested]})
+
+    assert response.status_code == 200
+    [result] = response.json()
+    assert result["status"] == 400
+    assert result["body"]["detail"] == "Nested batch requests are not allowed"
+
+
+def test_dispatch_header_from_outside_is_rejected(client):
+    response = client.post(
+        "/api/batch",
+        json={"requests": [{"path": "/no-such-route"}]},
+        headers={server.BATCH_DISPATCH_HEADER: "1"},
+    )
+
+    assert response.status_code == 400
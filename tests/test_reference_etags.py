@@ -0,0 +1,61 @@
+"""Tests for ETag revalidation on GET /api/personas and GET /api/goals"""
+
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "test_reference_etags")
+
+import server  # noqa: E402
+
+
+class FakeStorage:
+    def __init__(self):
+        self.goals = [SimpleNamespace(model_dump=lambda: {"id": "goal-1", "name": "Goal"}, metadata={})]
+
+    async def list_goals(self):
+        return self.goals
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    fake = FakeStorage()
+    monkeypatch.setattr(server, "storage", fake)
+    return fake
+
+
+@pytest.fixture
+def client():
+    with TestClient(server.app) as test_client:
+        yield test_client
+
+
+def test_matching_etag_gets_empty_304(client, storage):
+    first = client.get("/api/goals")
+    etag = first.headers["ETag"]
+
+    assert first.status_code == 200
+    assert first.json() == [{"id": "goal-1", "name": "Goal"}]
+
+    revalidated = client.get("/api/goals", headers={"If-None-Match": etag})
+
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+
+
+def test_changed_list_gets_new_body(client, storage):
+    etag = client.get("/api/goals").headers["ETag"]
+    storage.goals.append(SimpleNamespace(model_dump=lambda: {"id": "goal-2", "name": "Other"}, metadata={}))
+
+    response = client.get("/api/goals", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == 2
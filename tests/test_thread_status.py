@@ -0,0 +1,76 @@
+"""Tests for long-polling thread status"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "backend"))
+
+from thread_status import (  # noqa: E402
+    delete_thread_status,
+    set_thread_status,
+    status_waiters,
+    wait_for_thread_update,
+)
+
+
+def test_wait_returns_when_status_changes():
+    set_thread_status("wait-thread-a", "running")
+    # Changed from another thread, as a background simulation would
+    timer = threading.Timer(0.1, set_thread_status, ("wait-thread-a", "failed"))
+    timer.start()
+    try:
+        started = time.monotonic()
+        status = asyncio.run(wait_for_thread_update("wait-thread-a", "running", timeout=5))
+
+        assert status["status"] == "failed"
+        assert time.monotonic() - started < 2
+    finally:
+        timer.cancel()
+        delete_thread_status("wait-thread-a")
+
+
+def test_wait_wakes_when_status_is_deleted():
+    set_thread_status("wait-thread-b", "running")
+
+    async def wait_and_delete():
+        asyncio.get_running_loop().call_later(0.1, delete_thread_status, "wait-thread-b")
+        return await wait_for_thread_update("wait-thread-b", "running", timeout=5)
+
+    assert asyncio.run(wait_and_delete()) == {"status": "unknown"}
+
+
+def test_wait_times_out_on_unchanged_status():
+    set_thread_status("wait-thread-c", "running")
+    try:
+        status = asyncio.run(wait_for_thread_update("wait-thread-c", "running", timeout=0.1))
+
+        assert status["status"] == "running"
+        assert "wait-thread-c" not in status_waiters
+    finally:
+        delete_thread_status("wait-thread-c")
+
+
+def test_cancelled_wait_is_unregistered():
+    set_thread_status("wait-thread-d", "running")
+
+    async def cancel_wait():
+        task = asyncio.create_task(wait_for_thread_update("wait-thread-d", "running", timeout=30))
+        await asyncio.sleep(0.05)
+        assert "wait-thread-d" in status_waiters
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return True
+        return False
+
+    try:
+        started = time.monotonic()
+        assert asyncio.run(cancel_wait())
+        assert time.monotonic() - started < 2
+        assert "wait-thread-d" not in status_waiters
+    finally:
+        delete_thread_status("wait-thread-d")